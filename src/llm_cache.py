@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+===================================
+A股自选股智能分析系统 - LLM 响应缓存
+===================================
+
+职责：
+1. 精确缓存：以 sha256(prompt) 为键缓存 LLM 原始响应，命中时免去一次 LLM 往返
+2. 语义缓存：对新闻内容做本地向量化，余弦相似度超过阈值时复用历史响应
+3. 基于 SQLite 持久化，带 TTL 过期清理
+
+语义缓存依赖 sentence-transformers（可选依赖），未安装时自动退化为仅精确缓存。
+
+使用方式：
+    from src.llm_cache import LLMCache
+
+    cache = LLMCache(ttl=3600)
+    response = cache.get(key)
+    if response is None:
+        response = call_llm(prompt)
+        cache.set(key, response)
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 默认缓存目录与 TTL
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "stock_screener"
+DEFAULT_TTL = 3600
+
+# 语义缓存的相似度阈值（余弦相似度，向量已归一化）
+SEMANTIC_SIMILARITY_THRESHOLD = 0.92
+
+# 语义向量模型（多语言小模型，支持中文新闻）
+_EMBEDDING_MODEL_NAME = "paraphrase-multilingual-MiniLM-L12-v2"
+
+
+def prompt_cache_key(prompt: str) -> str:
+    """计算 prompt 的精确缓存键"""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    LLM 响应缓存（精确 + 语义两级）
+
+    精确级：sha256(prompt) -> 响应文本，适合完全重复的请求
+    语义级：新闻内容向量 -> 响应文本，适合措辞不同但内容相近的新闻
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl: int = DEFAULT_TTL):
+        """
+        初始化缓存
+
+        Args:
+            cache_dir: 缓存目录（默认 ~/.cache/stock_screener）
+            ttl: 缓存有效期（秒）
+        """
+        self.ttl = ttl
+        cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._db_path = cache_dir / "llm_cache.db"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        self._init_schema()
+
+        # 语义缓存组件（懒加载，可选依赖缺失时禁用）
+        self._embedder = None
+        self._semantic_enabled: Optional[bool] = None
+
+    def _init_schema(self) -> None:
+        """创建缓存表"""
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "  key TEXT PRIMARY KEY,"
+                "  value TEXT NOT NULL,"
+                "  embedding BLOB,"
+                "  created_at REAL NOT NULL"
+                ")"
+            )
+            self._conn.commit()
+
+    # === 精确缓存 ===
+
+    def get(self, key: str) -> Optional[str]:
+        """精确查询缓存，过期或不存在返回 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, created_at = row
+        if time.time() - created_at > self.ttl:
+            self._delete(key)
+            return None
+        return value
+
+    def set(self, key: str, value: str, embedding: Optional[bytes] = None) -> None:
+        """写入缓存（可附带语义向量）"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, embedding, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, embedding, time.time()),
+            )
+            self._conn.commit()
+
+    def _delete(self, key: str) -> None:
+        """删除单条缓存"""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    # === 语义缓存 ===
+
+    def _ensure_embedder(self) -> bool:
+        """懒加载向量模型；sentence-transformers 未安装时禁用语义缓存"""
+        if self._semantic_enabled is not None:
+            return self._semantic_enabled
+        try:
+            from sentence_transformers import SentenceTransformer
+            self._embedder = SentenceTransformer(_EMBEDDING_MODEL_NAME)
+            self._semantic_enabled = True
+        except ImportError:
+            logger.debug("sentence-transformers 未安装，语义缓存已禁用（仅精确缓存）")
+            self._semantic_enabled = False
+        except Exception as e:
+            logger.warning(f"语义向量模型加载失败，语义缓存已禁用: {e}")
+            self._semantic_enabled = False
+        return self._semantic_enabled
+
+    def embed(self, text: str) -> Optional[bytes]:
+        """计算文本的归一化向量（语义缓存禁用时返回 None）"""
+        if not self._ensure_embedder():
+            return None
+        try:
+            import numpy as np
+            vec = self._embedder.encode(text, normalize_embeddings=True)
+            return np.asarray(vec, dtype="float32").tobytes()
+        except Exception as e:
+            logger.debug(f"文本向量化失败: {e}")
+            return None
+
+    def get_semantic(self, embedding: Optional[bytes]) -> Optional[str]:
+        """
+        语义查询：在未过期条目中找余弦相似度最高的，超过阈值则复用
+
+        向量已归一化，余弦相似度即内积。
+        """
+        if embedding is None:
+            return None
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+
+        query_vec = np.frombuffer(embedding, dtype="float32")
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT value, embedding FROM llm_cache "
+                "WHERE embedding IS NOT NULL AND created_at > ?",
+                (cutoff,),
+            ).fetchall()
+
+        best_value, best_score = None, 0.0
+        for value, emb_blob in rows:
+            vec = np.frombuffer(emb_blob, dtype="float32")
+            if vec.shape != query_vec.shape:
+                continue
+            score = float(np.dot(query_vec, vec))
+            if score > best_score:
+                best_value, best_score = value, score
+
+        if best_value is not None and best_score >= SEMANTIC_SIMILARITY_THRESHOLD:
+            logger.debug(f"语义缓存命中，相似度 {best_score:.3f}")
+            return best_value
+        return None
+
+    # === 维护 ===
+
+    def purge_expired(self) -> int:
+        """清理过期条目，返回删除数量"""
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM llm_cache WHERE created_at <= ?", (cutoff,)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
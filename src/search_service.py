@@ -24,6 +24,35 @@ from newspaper import Article, Config
 
 logger = logging.getLogger(__name__)
 
+# 各 provider 共享的 HTTP 会话（连接池 + keep-alive + 传输层重试）
+_http_session: Optional[requests.Session] = None
+
+
+def get_http_session() -> requests.Session:
+    """
+    获取共享的 HTTP 会话单例
+
+    直接发 HTTP 请求的 provider（Bocha、Brave）复用同一个连接池，
+    连续多次搜索不再重复 TLS 握手；传输层失败自动退避重试 2 次。
+    """
+    global _http_session
+
+    if _http_session is None:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+
+    return _http_session
+
 
 def fetch_url_content(url: str, timeout: int = 5) -> str:
     """
@@ -556,8 +585,8 @@ class BochaSearchProvider(BaseSearchProvider):
                 "count": min(max_results, 50)  # 最大50条
             }
             
-            # 执行搜索
-            response = requests.post(url, headers=headers, json=payload, timeout=10)
+            # 执行搜索（复用共享会话的连接池）
+            response = get_http_session().post(url, headers=headers, json=payload, timeout=10)
             
             # 检查HTTP状态码
             if response.status_code != 200:
@@ -742,8 +771,8 @@ class BraveSearchProvider(BaseSearchProvider):
                 "safesearch": "moderate"
             }
 
-            # 执行搜索（GET 请求）
-            response = requests.get(
+            # 执行搜索（GET 请求，复用共享会话的连接池）
+            response = get_http_session().get(
                 self.API_ENDPOINT,
                 headers=headers,
                 params=params,
@@ -17,15 +17,97 @@ A股自选股智能分析系统 - 智能选股模块
     stocks = screener.screen_from_news(top_n=5)
 """
 
+import asyncio
+import atexit
+import heapq
+import json
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# orjson（Rust 实现）解析 JSON 比标准库快数倍，未安装时退回标准库
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_loads(s: str):
+    """解析 JSON 字符串（优先 orjson）"""
+    if _orjson is not None:
+        return _orjson.loads(s)
+    return json.loads(s)
+
+
+# 合法 A 股代码：市场前缀（上交所 60/68，深交所 00/30，北交所 83/43/87）
+# + 四位数字；单次 C 级正则匹配完成长度、数字、前缀三项校验
+_CODE_RE = re.compile(r'(?:60|68|00|30|83|43|87)[0-9]{4}\Z')
+
+# A 股市场前缀（批量路径上正则已保证 6 位数字时，只需再查前缀）
+_CODE_PREFIXES = frozenset({"60", "68", "00", "30", "83", "43", "87"})
+
+# 正文中的 A 股代码粗扫描：用数字环视而非 \b（中文与数字之间无 \b 边界）
+_CODE_SCAN_RE = re.compile(r'(?<![0-9])(?:60|68|00|30|83|43|87)[0-9]{4}(?![0-9])')
+
+
+@lru_cache(maxsize=256)
+def _format_news_items(items: Tuple[Tuple[str, str, str], ...]) -> str:
+    """格式化 (标题, 来源, 摘要) 元组为 LLM 输入文本（记忆化）"""
+    parts = [
+        f"[新闻{i}] {title}\n来源: {source}\n摘要: {snippet}\n"
+        for i, (title, source, snippet) in enumerate(items, 1)
+    ]
+    return "\n---\n".join(parts)
+
+
+# 股吧帖子链接格式: /news,股票代码,xxx.html
+_GUBA_HREF_RE = re.compile(r'/news,(\d{6}),')
+
+# 股吧抓取的请求头
+_GUBA_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Referer": "https://guba.eastmoney.com/",
+}
+
+# 股吧抓取的 HTTP 客户端（模块级复用，跨调用保持连接，省去 TCP/TLS 握手）
+_guba_client = None
+
+
+def _get_guba_client():
+    """
+    懒加载股吧 HTTP 客户端
+
+    优先 httpx（HTTP/2 可在一条连接上复用多个请求），h2 可选依赖未安装时
+    退回 HTTP/1.1 keep-alive，httpx 缺失时退回 requests.Session。
+    进程退出时自动关闭连接。
+    """
+    global _guba_client
+    if _guba_client is None:
+        try:
+            import httpx
+            # httpx 默认不跟随重定向（与 requests 相反），显式开启
+            try:
+                _guba_client = httpx.Client(
+                    http2=True, headers=_GUBA_HEADERS, timeout=10, follow_redirects=True
+                )
+            except ImportError:
+                _guba_client = httpx.Client(
+                    headers=_GUBA_HEADERS, timeout=10, follow_redirects=True
+                )
+        except ImportError:
+            import requests
+            _guba_client = requests.Session()
+            _guba_client.headers.update(_GUBA_HEADERS)
+        atexit.register(_guba_client.close)
+    return _guba_client
+
 
 class SignalType(Enum):
     """信号类型"""
@@ -34,9 +116,9 @@ class SignalType(Enum):
     NEUTRAL = "中性"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StockSignal:
-    """股票信号"""
+    """股票信号（不可变，可哈希，slots 省去每实例的 __dict__）"""
     code: str           # 股票代码 (如 600519, 300750)
     name: str           # 股票名称
     signal_type: SignalType
@@ -44,7 +126,13 @@ class StockSignal:
     source: str         # 新闻来源
     confidence: float   # 置信度 0-1
     news_title: str     # 新闻标题
-    
+    # 是否利好（构造时算好，排序/合并热路径直接读属性，免去枚举比较）
+    is_positive: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # frozen dataclass 需经 object.__setattr__ 写入派生字段
+        object.__setattr__(self, 'is_positive', self.signal_type is SignalType.POSITIVE)
+
     def __repr__(self):
         return f"StockSignal({self.code} {self.name} [{self.signal_type.value}] 置信度:{self.confidence:.0%})"
 
@@ -88,9 +176,13 @@ EXTRACT_STOCKS_PROMPT = """你是一个专业的 A 股分析师。请从以下
 
 ---
 新闻内容：
-{news_content}
+{{NEWS}}
 """
 
+# 模板里的 JSON 示例含大量花括号，str.format 会把它们当占位符解析（直接
+# KeyError），因此用字面量哨兵 + str.replace 做单次 C 级替换
+assert "{{NEWS}}" in EXTRACT_STOCKS_PROMPT
+
 # 搜索财经新闻的查询词
 NEWS_QUERIES = [
     # 传统财经新闻
@@ -107,6 +199,19 @@ NEWS_QUERIES = [
     "site:xueqiu.com 重仓 看好",
 ]
 
+# 并发搜索+提取的最大并发数（搜索和 LLM 都是 I/O 密集，适度并发即可）
+MAX_CONCURRENT_QUERIES = 5
+
+# 批量提取时 prompt 的字符预算（约 4 字符/token，超出则退回逐查询提取）
+BATCH_PROMPT_MAX_CHARS = 100_000
+
+# 单查询提取的输出 token 上限
+DEFAULT_MAX_OUTPUT_TOKENS = 2048
+
+# 批量提取的输出 token 上限：聚合多个查询可能提出几十只股票，
+# 上限太低会把 JSON 截断在中间导致整轮解析失败
+BATCH_MAX_OUTPUT_TOKENS = 8192
+
 
 class StockScreener:
     """智能选股器"""
@@ -123,7 +228,8 @@ class StockScreener:
         self.config = config
         self._search_service = search_service
         self._analyzer = analyzer
-        
+        self._llm_cache = None
+
     @property
     def search_service(self):
         """懒加载搜索服务"""
@@ -145,27 +251,104 @@ class StockScreener:
             api_key = getattr(self.config, 'gemini_api_key', None)
             self._analyzer = GeminiAnalyzer(api_key=api_key)
         return self._analyzer
-    
-    def _generate_content(self, prompt: str) -> Optional[str]:
+
+    @property
+    def llm_cache(self):
+        """懒加载 LLM 响应缓存（初始化失败时返回 None，不影响主流程）"""
+        if self._llm_cache is None:
+            try:
+                from src.llm_cache import LLMCache
+                self._llm_cache = LLMCache()
+            except Exception as e:
+                logger.debug("LLM 缓存初始化失败，本次运行不使用缓存: %s", e)
+                self._llm_cache = False
+        return self._llm_cache or None
+
+    def _generate_content(self, prompt: str, max_output_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS) -> Optional[str]:
         """调用 LLM 生成内容"""
         try:
             # 检查 analyzer 是否可用
             if not self.analyzer.is_available():
                 logger.warning("AI 分析器不可用")
                 return None
-            
+
             # 使用 analyzer 的内部方法调用 API
             generation_config = {
                 "temperature": 0.7,
-                "max_output_tokens": 2048,
+                "max_output_tokens": max_output_tokens,
             }
             result = self.analyzer._call_api_with_retry(prompt, generation_config)
-            logger.debug(f"LLM 响应长度: {len(result) if result else 0}")
+            logger.debug("LLM 响应长度: %d", len(result) if result else 0)
             return result
         except Exception as e:
-            logger.warning(f"LLM 调用失败: {type(e).__name__}: {e}")
+            logger.warning("LLM 调用失败: %s: %s", type(e).__name__, e)
             return None
-    
+
+    def _generate_content_stream(self, prompt: str, max_output_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS) -> Optional[str]:
+        """
+        流式调用 LLM，边接收边解析
+
+        LLM 常在 JSON 之后追加说明文字；每收到一个分块就尝试 raw_decode，
+        第一个完整 JSON 对象闭合后立即停止消费剩余分块，不再等待尾部
+        token。仅 Gemini 原生模型支持流式，其余路径（OpenAI 兼容模式、
+        流式调用异常）退回阻塞的 _generate_content（自带重试）。
+        """
+        try:
+            if not self.analyzer.is_available():
+                logger.warning("AI 分析器不可用")
+                return None
+            model = getattr(self.analyzer, '_model', None)
+            if model is None or getattr(self.analyzer, '_use_openai', False):
+                return self._generate_content(prompt, max_output_tokens)
+
+            stream = model.generate_content(
+                prompt,
+                generation_config={
+                    "temperature": 0.7,
+                    "max_output_tokens": max_output_tokens,
+                },
+                request_options={"timeout": 120},
+                stream=True,
+            )
+        except Exception as e:
+            logger.debug("流式调用不可用，退回阻塞调用: %s", e)
+            return self._generate_content(prompt, max_output_tokens)
+
+        decoder = json.JSONDecoder()
+        parts: List[str] = []
+        try:
+            for chunk in stream:
+                text = getattr(chunk, 'text', '') or ''
+                if not text:
+                    continue
+                parts.append(text)
+                buffered = ''.join(parts)
+                idx = buffered.find('{')
+                if idx == -1:
+                    continue
+                try:
+                    decoder.raw_decode(buffered, idx)
+                except json.JSONDecodeError:
+                    continue
+                # 第一个完整对象已闭合，提前结束流（finally 中关闭连接）
+                logger.debug("流式响应提前闭合，已接收 %d 字符", len(buffered))
+                return buffered
+            response = ''.join(parts)
+            logger.debug("LLM 响应长度: %d", len(response))
+            return response or None
+        except Exception as e:
+            logger.warning("流式 LLM 调用失败，退回阻塞调用: %s: %s", type(e).__name__, e)
+            return self._generate_content(prompt, max_output_tokens)
+        finally:
+            # 提前退出时显式关流，让服务端停止生成、连接立即归还，
+            # 而不是等 GC；正常耗尽时关闭同样无害
+            close = getattr(stream, 'close', None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    logger.debug("关闭流式响应失败: %s", e)
+
     def screen_from_news(self, top_n: int = 10, queries: List[str] = None) -> List[StockSignal]:
         """
         从新闻中筛选股票
@@ -178,37 +361,149 @@ class StockScreener:
             按置信度排序的股票信号列表
         """
         queries = queries or NEWS_QUERIES
-        all_signals: List[StockSignal] = []
-        seen_codes = set()
-        
-        logger.info(f"🔍 开始新闻选股，搜索 {len(queries)} 个关键词...")
-        
-        for query in queries:
-            try:
-                signals = self._search_and_extract(query)
-                for signal in signals:
-                    if signal.code not in seen_codes:
-                        all_signals.append(signal)
-                        seen_codes.add(signal.code)
-                        logger.info(f"  发现: {signal}")
-            except Exception as e:
-                logger.warning(f"搜索 '{query}' 失败: {e}")
-                continue
-        
-        # 按置信度排序，优先利好
-        all_signals.sort(key=lambda x: (
-            x.signal_type == SignalType.POSITIVE,  # 利好优先
-            x.confidence  # 置信度高优先
-        ), reverse=True)
-        
-        result = all_signals[:top_n]
-        logger.info(f"✅ 新闻选股完成，发现 {len(all_signals)} 只，返回 Top {len(result)}")
+
+        logger.info("🔍 开始新闻选股，搜索 %d 个关键词...", len(queries))
+
+        all_signals = asyncio.run(self._screen_from_news_async(queries))
+
+        # 取 Top N：利好优先，其次置信度高优先；nlargest 为 O(k log n)，免去整体排序
+        # attrgetter 是 C 实现的排序键，比 lambda 快
+        result = heapq.nlargest(top_n, all_signals, key=attrgetter('is_positive', 'confidence'))
+        logger.info("✅ 新闻选股完成，发现 %d 只，返回 Top %d", len(all_signals), len(result))
         
         return result
-    
-    def _search_and_extract(self, query: str) -> List[StockSignal]:
-        """搜索新闻并提取股票"""
-        # 1. 搜索新闻（使用第一个可用的 provider）
+
+    async def _screen_from_news_async(self, queries: List[str]) -> List[StockSignal]:
+        """
+        并发搜索所有关键词，再把结果合并为一次 LLM 提取
+
+        搜索是 I/O 等待，用 asyncio.gather 并发后约等于最慢一个的耗时。
+        提取阶段把所有查询的新闻拼进一个 prompt，单次 LLM 调用即可，
+        省去逐查询调用的固定开销（TLS、排队、系统提示词 token）；
+        拼接超出预算时退回逐查询并发提取。去重在汇总之后统一进行，
+        避免任务间共享状态需要加锁。
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+
+        async def _bounded_search(query: str) -> List:
+            async with semaphore:
+                return await asyncio.to_thread(self._search_news, query)
+
+        search_results = await asyncio.gather(
+            *(_bounded_search(q) for q in queries),
+            return_exceptions=True,
+        )
+
+        # 收集非空结果，跳过失败的查询
+        query_results: List[Tuple[str, List]] = []
+        for query, results in zip(queries, search_results):
+            if isinstance(results, BaseException):
+                logger.warning("搜索 '%s' 失败: %s", query, results)
+            elif results:
+                query_results.append((query, results))
+
+        if not query_results:
+            return []
+
+        # 多个关键词常命中同一篇文章，先跨查询去重再送 LLM，省输入 token
+        query_results = self._dedup_results(query_results)
+        if not query_results:
+            return []
+
+        signals = await self._extract_all_async(query_results, semaphore)
+
+        all_signals: List[StockSignal] = []
+        seen_codes = set()
+        for signal in signals:
+            if signal.code not in seen_codes:
+                all_signals.append(signal)
+                seen_codes.add(signal.code)
+                logger.info("  发现: %s", signal)
+
+        return all_signals
+
+    async def _extract_all_async(
+        self, query_results: List[Tuple[str, List]], semaphore: asyncio.Semaphore
+    ) -> List[StockSignal]:
+        """批量 LLM 提取；prompt 超预算时退回逐查询并发提取"""
+        # 纯行情评论常不含具体代码，这类查询 LLM 也提不出结果，提前丢弃
+        filtered: List[Tuple[str, List]] = []
+        for query, results in query_results:
+            if _CODE_SCAN_RE.search(self._format_news_for_llm(results)):
+                filtered.append((query, results))
+            else:
+                logger.debug("查询 '%s' 的新闻不含 A 股代码，跳过 LLM 提取", query)
+        query_results = filtered
+        if not query_results:
+            return []
+
+        # 拼接所有查询的新闻，用分隔符保留查询上下文
+        sections = []
+        for k, (query, results) in enumerate(query_results, 1):
+            news_content = self._format_news_for_llm(results)
+            sections.append(f"=== QUERY {k}: {query} ===\n{news_content}")
+        combined_content = "\n\n".join(sections)
+
+        if len(combined_content) + len(EXTRACT_STOCKS_PROMPT) <= BATCH_PROMPT_MAX_CHARS:
+            logger.debug("批量提取 %d 个查询的新闻（单次 LLM 调用）", len(query_results))
+            # 跨查询合并后无法把单只股票归因到具体文章，传空结果集让
+            # 来源/标题退回通用值，避免把首篇文章错误标到所有信号上
+            batch_signals = await asyncio.to_thread(
+                self._extract_stocks_from_news, combined_content, [],
+                BATCH_MAX_OUTPUT_TOKENS,
+            )
+            if batch_signals is not None:
+                return batch_signals
+            # 批量响应可能被截断或解析失败，退回逐查询提取，避免整轮颗粒无收
+            logger.warning("批量提取未得到可解析结果，退回逐查询提取")
+        else:
+            # 超出预算：退回逐查询提取（仍然并发）
+            logger.debug("新闻内容超出批量 prompt 预算，退回逐查询提取")
+
+        async def _bounded_extract(results: List) -> Optional[List[StockSignal]]:
+            async with semaphore:
+                news_content = self._format_news_for_llm(results)
+                return await asyncio.to_thread(
+                    self._extract_stocks_from_news, news_content, results
+                )
+
+        extracted = await asyncio.gather(
+            *(_bounded_extract(results) for _, results in query_results),
+            return_exceptions=True,
+        )
+
+        signals: List[StockSignal] = []
+        for (query, _), result in zip(query_results, extracted):
+            if isinstance(result, BaseException):
+                logger.warning("LLM 提取股票失败 for '%s': %s", query, result)
+            elif result:
+                signals.extend(result)
+        return signals
+
+    @staticmethod
+    def _dedup_results(query_results: List[Tuple[str, List]]) -> List[Tuple[str, List]]:
+        """
+        跨查询去重搜索结果，保留首次出现
+
+        以 URL 为去重键，URL 缺失时退回 (标题, 摘要) 元组。
+        去重后结果为空的查询整体丢弃。
+        """
+        seen = set()
+        deduped: List[Tuple[str, List]] = []
+        for query, results in query_results:
+            kept = []
+            for r in results:
+                key = getattr(r, 'url', '') or (r.title, r.snippet)
+                if key in seen:
+                    continue
+                seen.add(key)
+                kept.append(r)
+            if kept:
+                deduped.append((query, kept))
+        return deduped
+
+    def _search_news(self, query: str) -> List:
+        """搜索新闻（使用第一个可用的 provider），返回结果列表"""
         response = None
         for provider in self.search_service._providers:
             if provider.is_available:
@@ -217,64 +512,81 @@ class StockScreener:
                     if response.success and response.results:
                         break
                 except Exception as e:
-                    logger.debug(f"Provider {provider.__class__.__name__} 搜索失败: {e}")
+                    logger.debug("Provider %s 搜索失败: %s", provider.__class__.__name__, e)
                     continue
-        
+
         if not response or not response.success or not response.results:
-            logger.debug(f"搜索 '{query}' 无结果")
-            return []
-        
-        logger.debug(f"搜索 '{query}' 获得 {len(response.results)} 条结果")
-        
-        # 2. 组装新闻内容
-        news_content = self._format_news_for_llm(response.results)
-        
-        # 3. 调用 LLM 提取
-        try:
-            signals = self._extract_stocks_from_news(news_content, response.results)
-            return signals
-        except Exception as e:
-            logger.warning(f"LLM 提取股票失败 for '{query}': {type(e).__name__}: {e}")
+            logger.debug("搜索 '%s' 无结果", query)
             return []
+
+        logger.debug("搜索 '%s' 获得 %d 条结果", query, len(response.results))
+        return response.results
     
+    def _cached_generate_content(
+        self, prompt: str, news_content: str, max_output_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS
+    ) -> Optional[str]:
+        """
+        带缓存的 LLM 调用
+
+        两级查询：先按 sha256(prompt) 精确匹配，再按新闻内容向量做语义匹配
+        （相近新闻复用历史响应）。都未命中才真正调用 LLM，并回写缓存。
+        """
+        cache = self.llm_cache
+        if cache is None:
+            return self._generate_content_stream(prompt, max_output_tokens)
+
+        from src.llm_cache import prompt_cache_key
+
+        cache_key = prompt_cache_key(prompt)
+        response = cache.get(cache_key)
+        if response is not None:
+            logger.debug("LLM 精确缓存命中，跳过 LLM 调用")
+            return response
+
+        embedding = cache.embed(news_content)
+        response = cache.get_semantic(embedding)
+        if response is not None:
+            logger.debug("LLM 语义缓存命中，跳过 LLM 调用")
+            return response
+
+        response = self._generate_content_stream(prompt, max_output_tokens)
+        if response:
+            cache.set(cache_key, response, embedding)
+        return response
+
     def _format_news_for_llm(self, results) -> str:
-        """格式化新闻供 LLM 分析"""
-        parts = []
-        for i, r in enumerate(results, 1):
-            parts.append(f"[新闻{i}] {r.title}\n来源: {r.source}\n摘要: {r.snippet}\n")
-        return "\n---\n".join(parts)
+        """格式化新闻供 LLM 分析（同一批结果的重复格式化走缓存）"""
+        return _format_news_items(
+            tuple((r.title, r.source, r.snippet) for r in results)
+        )
     
-    def _extract_stocks_from_news(self, news_content: str, results) -> List[StockSignal]:
-        """用 LLM 从新闻中提取股票"""
-        import json
-        
-        prompt = EXTRACT_STOCKS_PROMPT.format(news_content=news_content)
-        
+    def _extract_stocks_from_news(
+        self, news_content: str, results, max_output_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS
+    ) -> Optional[List[StockSignal]]:
+        """
+        用 LLM 从新闻中提取股票
+
+        返回 None 表示 LLM 调用或响应解析失败（例如输出被截断），
+        区别于"新闻中无值得关注股票"的空列表，调用方可据此降级重试。
+        """
+        # 不含任何 A 股代码的内容直接跳过，省一次 LLM 往返
+        if not _CODE_SCAN_RE.search(news_content):
+            logger.debug("新闻内容不含 A 股代码，跳过 LLM 提取")
+            return []
+
+        prompt = EXTRACT_STOCKS_PROMPT.replace("{{NEWS}}", news_content)
+
         try:
-            response = self._generate_content(prompt)
+            response = self._cached_generate_content(prompt, news_content, max_output_tokens)
             if not response:
                 logger.debug("LLM 返回空响应")
-                return []
-            
-            # 提取 JSON - 尝试找到包含 "stocks" 的 JSON 对象
-            # 先尝试找 ```json ... ``` 代码块
-            code_block_match = re.search(r'```(?:json)?\s*(\{[\s\S]*?\})\s*```', response)
-            if code_block_match:
-                json_str = code_block_match.group(1)
-            else:
-                # 否则找最外层的 { }
-                json_match = re.search(r'\{[^{}]*"stocks"[^{}]*\[[\s\S]*?\]\s*\}', response)
-                if json_match:
-                    json_str = json_match.group()
-                else:
-                    # 最后尝试任何 JSON 对象
-                    json_match = re.search(r'\{[\s\S]*\}', response)
-                    if not json_match:
-                        logger.debug(f"无法从 LLM 响应中提取 JSON: {response[:200]}...")
-                        return []
-                    json_str = json_match.group()
-            
-            data = json.loads(json_str)
+                return None
+
+            data = self._extract_json_object(response)
+            if data is None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("无法从 LLM 响应中提取 JSON: %s...", response[:200])
+                return None
             stocks_data = data.get("stocks", [])
             
             signals = []
@@ -301,18 +613,50 @@ class StockScreener:
             return signals
             
         except Exception as e:
-            logger.warning(f"LLM 提取股票失败: {e}")
-            return []
-    
-    def _is_valid_stock_code(self, code: str) -> bool:
+            logger.warning("LLM 提取股票失败: %s", e)
+            return None
+
+    @staticmethod
+    def _extract_json_object(response: str) -> Optional[Dict]:
+        """
+        从 LLM 响应中提取第一个 JSON 对象
+
+        典型响应本身就是干净的 JSON（或带 ```json 围栏），直接 json.loads
+        即可，无需正则扫描整段文本。解析失败时退化为 raw_decode：定位首个
+        '{' 后单次 O(n) 扫描，在第一个完整对象结束处停止。
+        """
+        stripped = response.strip()
+        # 去掉 ```json ... ``` 围栏
+        if stripped.startswith("```"):
+            stripped = stripped[3:]
+            if stripped.startswith("json"):
+                stripped = stripped[4:]
+            if stripped.endswith("```"):
+                stripped = stripped[:-3]
+            stripped = stripped.strip()
+
+        try:
+            data = _json_loads(stripped)
+            if isinstance(data, dict):
+                return data
+        except ValueError:
+            pass
+
+        # 兜底：JSON 前后夹杂说明文字时，从首个 '{' 开始解析第一个完整对象
+        # （orjson 不支持增量解析，这条低频路径保持标准库 raw_decode）
+        idx = response.find("{")
+        if idx == -1:
+            return None
+        try:
+            data, _ = json.JSONDecoder().raw_decode(response, idx)
+            return data if isinstance(data, dict) else None
+        except json.JSONDecodeError:
+            return None
+
+    @staticmethod
+    def _is_valid_stock_code(code: str) -> bool:
         """验证是否是有效的 A 股代码"""
-        if not code or not code.isdigit():
-            return False
-        if len(code) != 6:
-            return False
-        # 上交所: 60/68, 深交所: 00/30, 北交所: 8/4
-        prefix = code[:2]
-        return prefix in ("60", "68", "00", "30", "83", "43", "87")
+        return bool(code and _CODE_RE.match(code))
     
     def get_stock_codes(self, top_n: int = 10) -> List[str]:
         """
@@ -329,62 +673,93 @@ class StockScreener:
         
         备用数据源，当搜索服务不可用时使用
         """
-        import requests
-        from bs4 import BeautifulSoup
-        
+        from concurrent.futures import ThreadPoolExecutor
+
         signals = []
         seen_codes = set()
-        
+
         try:
             # 获取股吧热门帖子页面
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Referer": "https://guba.eastmoney.com/",
-            }
-            
             urls = [
                 "https://guba.eastmoney.com/",  # 首页热帖
                 "https://guba.eastmoney.com/rank/",  # 人气榜
             ]
-            
-            for url in urls:
+
+            # 复用模块级客户端保持连接，两个页面并行抓取
+            client = _get_guba_client()
+
+            with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+                futures = {url: executor.submit(client.get, url, timeout=10) for url in urls}
+
+            for url, future in futures.items():
                 try:
-                    resp = requests.get(url, headers=headers, timeout=10)
+                    resp = future.result()
                     resp.encoding = 'utf-8'
-                    soup = BeautifulSoup(resp.text, 'html.parser')
-                    
-                    # 提取帖子标题和链接
-                    for link in soup.find_all('a', href=True):
-                        href = link.get('href', '')
-                        title = link.get_text(strip=True)
-                        
-                        # 股吧帖子链接格式: /news,股票代码,xxx.html
-                        if '/news,' in href and title:
-                            parts = href.split(',')
-                            if len(parts) >= 2:
-                                code = parts[1]
-                                if self._is_valid_stock_code(code) and code not in seen_codes:
-                                    seen_codes.add(code)
-                                    signals.append(StockSignal(
-                                        code=code,
-                                        name="",  # 稍后可通过 API 获取名称
-                                        signal_type=SignalType.NEUTRAL,
-                                        reason=title[:100],
-                                        source="东财股吧",
-                                        confidence=0.5,
-                                        news_title=title,
-                                    ))
+
+                    for href, title in self._parse_guba_links(resp.text):
+                        if not title:
+                            continue
+                        match = _GUBA_HREF_RE.search(href)
+                        if match:
+                            # 正则捕获组已保证 6 位 ASCII 数字，只剩前缀校验
+                            code = match.group(1)
+                            if code[:2] in _CODE_PREFIXES and code not in seen_codes:
+                                seen_codes.add(code)
+                                signals.append(StockSignal(
+                                    code=code,
+                                    name="",  # 稍后可通过 API 获取名称
+                                    signal_type=SignalType.NEUTRAL,
+                                    reason=title[:100],
+                                    source="东财股吧",
+                                    confidence=0.5,
+                                    news_title=title,
+                                ))
                 except Exception as e:
-                    logger.debug(f"获取 {url} 失败: {e}")
+                    logger.debug("获取 %s 失败: %s", url, e)
                     continue
-            
-            logger.info(f"📊 股吧热帖发现 {len(signals)} 只股票")
-            
+
+            logger.info("📊 股吧热帖发现 %d 只股票", len(signals))
+
         except Exception as e:
-            logger.warning(f"股吧数据获取失败: {e}")
-        
+            logger.warning("股吧数据获取失败: %s", e)
+
         return signals[:top_n]
-    
+
+    @staticmethod
+    def _parse_guba_links(html: str) -> List[Tuple[str, str]]:
+        """
+        解析股吧页面中的帖子锚点，返回 (href, 标题) 列表
+
+        优先使用 selectolax（Modest C 引擎，遍历锚点几乎无 Python 对象开销），
+        未安装时退回 BeautifulSoup + lxml，再退回内置 html.parser。
+        """
+        try:
+            from selectolax.parser import HTMLParser
+        except ImportError:
+            HTMLParser = None
+
+        if HTMLParser is not None:
+            tree = HTMLParser(html)
+            return [
+                (a.attributes.get('href') or '', a.text(strip=True))
+                for a in tree.css('a[href*="/news,"]')
+            ]
+
+        from bs4 import BeautifulSoup
+
+        # lxml（C 实现）比内置 html.parser 快 3-5 倍
+        try:
+            import lxml  # noqa: F401
+            parser = 'lxml'
+        except ImportError:
+            parser = 'html.parser'
+
+        soup = BeautifulSoup(html, parser)
+        return [
+            (link.get('href', ''), link.get_text(strip=True))
+            for link in soup.find_all('a', href=_GUBA_HREF_RE)
+        ]
+
     def screen_combined(self, top_n: int = 10) -> List[StockSignal]:
         """
         综合选股：结合新闻 + 股吧讨论
@@ -399,7 +774,7 @@ class StockScreener:
         try:
             guba_signals = self.screen_from_guba(top_n=top_n)
         except Exception as e:
-            logger.debug(f"股吧数据获取失败，跳过: {e}")
+            logger.debug("股吧数据获取失败，跳过: %s", e)
         
         # 3. 合并去重
         seen_codes = set()
@@ -407,7 +782,7 @@ class StockScreener:
         
         # 先加新闻利好
         for s in news_signals:
-            if s.code not in seen_codes and s.signal_type == SignalType.POSITIVE:
+            if s.code not in seen_codes and s.is_positive:
                 combined.append(s)
                 seen_codes.add(s.code)
         
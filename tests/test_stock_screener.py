@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+===================================
+A股自选股智能分析系统 - 智能选股单元测试
+===================================
+
+职责：
+1. 验证 LLM 响应的 JSON 提取逻辑（干净 JSON / 围栏 / 夹杂文字 / 非法输入）
+2. 验证 A 股代码校验规则
+"""
+
+import unittest
+
+from src.stock_screener import EXTRACT_STOCKS_PROMPT, SignalType, StockScreener
+
+
+class ExtractJsonObjectTestCase(unittest.TestCase):
+    """LLM 响应 JSON 提取测试"""
+
+    def test_clean_json(self) -> None:
+        """干净的 JSON 对象直接解析"""
+        data = StockScreener._extract_json_object('{"stocks": []}')
+        self.assertEqual(data, {"stocks": []})
+
+    def test_fenced_json(self) -> None:
+        """```json 围栏包裹的对象"""
+        response = '```json\n{"stocks": [{"code": "600519"}]}\n```'
+        data = StockScreener._extract_json_object(response)
+        self.assertEqual(data["stocks"][0]["code"], "600519")
+
+    def test_fenced_json_without_language_tag(self) -> None:
+        """无语言标记的 ``` 围栏"""
+        response = '```\n{"stocks": []}\n```'
+        data = StockScreener._extract_json_object(response)
+        self.assertEqual(data, {"stocks": []})
+
+    def test_json_surrounded_by_prose(self) -> None:
+        """JSON 前后夹杂说明文字时取第一个完整对象"""
+        response = '好的，以下是提取结果：\n{"stocks": []}\n以上仅供参考。'
+        data = StockScreener._extract_json_object(response)
+        self.assertEqual(data, {"stocks": []})
+
+    def test_invalid_response_returns_none(self) -> None:
+        """完全无 JSON 的响应返回 None"""
+        self.assertIsNone(StockScreener._extract_json_object("新闻中没有相关股票"))
+
+    def test_non_object_json_returns_none(self) -> None:
+        """顶层不是对象（如数组）时返回 None"""
+        self.assertIsNone(StockScreener._extract_json_object("[1, 2, 3]"))
+
+
+class ValidStockCodeTestCase(unittest.TestCase):
+    """A 股代码校验测试"""
+
+    def test_valid_codes(self) -> None:
+        """沪深北三市的合法代码"""
+        for code in ("600519", "688981", "000001", "300750", "830799", "430047", "870001"):
+            self.assertTrue(StockScreener._is_valid_stock_code(code), code)
+
+    def test_invalid_codes(self) -> None:
+        """非法代码：空串、非数字、长度不符、前缀不符"""
+        for code in ("", "abc123", "60051", "6005190", "123456", "999999"):
+            self.assertFalse(StockScreener._is_valid_stock_code(code), code)
+
+
+class ExtractStocksFromNewsTestCase(unittest.TestCase):
+    """LLM 股票提取端到端测试（LLM 调用打桩）"""
+
+    def _make_screener(self, llm_response: str) -> StockScreener:
+        """构造 LLM 响应固定的选股器（不触发真实模型/网络调用）"""
+        screener = StockScreener(config=None)
+        screener._llm_cache = False  # 禁用缓存
+        # 生产路径经 _generate_content_stream 调用 LLM，在此打桩保证测试封闭
+        screener._generate_content_stream = lambda prompt, *args, **kwargs: llm_response
+        return screener
+
+    def test_prompt_contains_news_content(self) -> None:
+        """新闻内容被替换进模板，JSON 示例花括号原样保留"""
+        prompt = EXTRACT_STOCKS_PROMPT.replace("{{NEWS}}", "测试新闻")
+        self.assertIn("测试新闻", prompt)
+        self.assertIn('"stocks"', prompt)
+        self.assertNotIn("{{NEWS}}", prompt)
+
+    def test_extract_signals(self) -> None:
+        """合法响应被解析为 StockSignal，非法代码被过滤"""
+        response = (
+            '{"stocks": ['
+            '{"code": "600519", "name": "贵州茅台", "signal": "positive", "confidence": 0.85, "reason": "提价"},'
+            '{"code": "999999", "name": "非法", "signal": "positive", "confidence": 0.9, "reason": "x"}'
+            ']}'
+        )
+        screener = self._make_screener(response)
+        signals = screener._extract_stocks_from_news("贵州茅台(600519)宣布提价", results=[])
+        self.assertEqual(len(signals), 1)
+        self.assertEqual(signals[0].code, "600519")
+        self.assertIs(signals[0].signal_type, SignalType.POSITIVE)
+        self.assertAlmostEqual(signals[0].confidence, 0.85)
+
+    def test_empty_response_returns_no_signals(self) -> None:
+        """LLM 返回空 stocks 时无信号"""
+        screener = self._make_screener('{"stocks": []}')
+        self.assertEqual(
+            screener._extract_stocks_from_news("沪指600519点位波动", results=[]), []
+        )
+
+    def test_unparseable_response_returns_none(self) -> None:
+        """响应无法解析（如输出被截断）时返回 None，供调用方降级重试"""
+        screener = self._make_screener('{"stocks": [{"code": "600')
+        self.assertIsNone(
+            screener._extract_stocks_from_news("贵州茅台(600519)宣布提价", results=[])
+        )
+
+    def test_skip_llm_when_no_stock_codes(self) -> None:
+        """新闻内容不含 A 股代码时不调用 LLM"""
+        screener = StockScreener(config=None)
+        screener._llm_cache = False
+
+        def _fail(prompt, *args, **kwargs):
+            raise AssertionError("不应调用 LLM")
+
+        screener._generate_content_stream = _fail
+        self.assertEqual(
+            screener._extract_stocks_from_news("大盘今日震荡整理，无具体个股", results=[]), []
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()